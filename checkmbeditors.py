@@ -8,21 +8,77 @@ Run it in the folder where you want the download to happen:
     python checkmbeditors.py
 
 You will be prompted to paste the dump URL and the snapshot date.
+
+Optional speed-ups (used automatically when installed):
+    pip install indexed_bzip2  # parallel .tar.bz2 extraction
+    pip install numpy          # faster top-500 selection
+    pip install numba          # compiled edit-file scan (fastest)
 """
 
 import os
+import re
 import sys
 import json
+import mmap
+import heapq
 import shutil
 import tarfile
 import urllib.request
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 
+try:  # optional: multi-core bzip2 decompression
+    import indexed_bzip2
+except ImportError:
+    indexed_bzip2 = None
+
+try:  # optional: C-level counting of editor ids
+    import numpy as np
+except ImportError:
+    np = None
+
+try:  # optional: compiled, multithreaded edit-file scan (needs numpy)
+    import numba
+    from numba import prange
+except ImportError:
+    numba = None
+    prange = range
+
 APPLIED_STATUS_CODE = 2  # MusicBrainz STATUS_APPLIED
 NEEDED_TARBALLS = ["mbdump-editor.tar.bz2", "mbdump-edit.tar.bz2"]
 JSON_SUBFOLDER = "json"
 
+# One applied row of the edit table: id, editor, type, status, followed by
+# at least one more column. All four are integer columns, so they never
+# carry COPY escapes. A row whose id, editor or type is not all digits (or
+# is \N), or whose status is not exactly 2, is skipped by every scan
+# backend rather than failing the run. Anchoring on the newline in front of
+# each row (rather than ^ with re.M) lets the regex engine hop from row to
+# row with its fast literal search. The digit runs are possessive (Python
+# 3.11+) so a row that does not match is rejected without backtracking
+# through every shorter run of digits.
+try:
+    APPLIED_EDIT_ROW = re.compile(rb"\n\d++\t(\d++)\t\d++\t%d\t" % APPLIED_STATUS_CODE)
+except re.error:
+    APPLIED_EDIT_ROW = re.compile(rb"\n\d+\t(\d+)\t\d+\t%d\t" % APPLIED_STATUS_CODE)
+SCAN_CHUNK_SIZE = 64 * 1024 * 1024
+READ_BUFFER_SIZE = 1024 * 1024
+
+# Page-cache hints for the multi-GB dump files; None where the platform has
+# no posix_fadvise (Windows, macOS).
+FADV_SEQUENTIAL = getattr(os, "POSIX_FADV_SEQUENTIAL", None)
+FADV_DONTNEED = getattr(os, "POSIX_FADV_DONTNEED", None)
+
+# Result of every backslash + 1-3 digit escape in COPY text, so unescape_pg
+# never has to run int(..., 8). Runs containing 8 or 9 are not octal and
+# are kept as written.
+PG_OCTAL_ESCAPES = {
+    octs: chr(int(octs, 8)) if not octs.strip("01234567") else "\\" + octs
+    for octs in (f"{n:0{w}d}" for w in (1, 2, 3) for n in range(10 ** w))
+}
+
 DATE_FORMATS = [
     "%Y-%m-%d",       # 2026-05-17
     "%d-%m-%Y",       # 17-05-2026
@@ -96,23 +152,44 @@ def download_dumps(base_url: str, folder: str) -> list[str]:
 # Extract
 # ---------------------------------------------------------------------------
 
+@contextmanager
+def open_tarball(tar_path: str):
+    """Open a .tar.bz2 for reading, decompressing on all cores if possible."""
+    if indexed_bzip2 is None:
+        with tarfile.open(tar_path, "r:bz2") as tf:
+            yield tf
+        return
+    with indexed_bzip2.open(tar_path, parallelization=os.cpu_count() or 1) as raw:
+        with tarfile.open(fileobj=raw, mode="r:") as tf:
+            yield tf
+
+
 def extract_member(tar_path: str, wanted: list[str], target_root: str):
     print(f"  Extracting from {os.path.basename(tar_path)} ...", flush=True)
     os.makedirs(target_root, exist_ok=True)
-    with tarfile.open(tar_path, "r:bz2") as tf:
-        members_by_name = {m.name: m for m in tf.getmembers()}
-        for name in wanted:
-            m = members_by_name.get(name)
-            if m is None:
-                for cand_name, cand in members_by_name.items():
-                    if cand_name.endswith(name):
-                        m = cand
-                        break
-            if m is None:
-                print(f"  ! Warning: {name} not found in archive")
+    wanted_set = set(wanted)
+    wanted_suffixes = tuple(wanted)
+    found = set()
+    with open_tarball(tar_path) as tf:
+        # Walk the headers once, in archive order, and stop as soon as every
+        # wanted member is out instead of indexing the whole archive first.
+        for m in tf:
+            name = m.name
+            if name not in wanted_set:
+                # One C-level endswith rejects almost every member.
+                if not name.endswith(wanted_suffixes):
+                    continue
+                name = next(w for w in wanted if name.endswith(w))
+            if name in found:
                 continue
             print(f"    - {m.name}")
             tf.extract(m, path=target_root)
+            found.add(name)
+            if len(found) == len(wanted):
+                break
+    for name in wanted:
+        if name not in found:
+            print(f"  ! Warning: {name} not found in archive")
 
 
 def extract_all(folder: str) -> tuple[str, str]:
@@ -143,24 +220,30 @@ def extract_all(folder: str) -> tuple[str, str]:
 # Parse
 # ---------------------------------------------------------------------------
 
+def fadvise(fd: int, advice, offset: int = 0, length: int = 0):
+    """os.posix_fadvise, or nothing if the platform does not support it."""
+    if advice is not None:
+        os.posix_fadvise(fd, offset, length, advice)
+
+
 def unescape_pg(val: str):
     if val == r"\N":
         return None
-    if "\\" not in val:
+    j = val.find("\\")
+    if j < 0:
         return val
+    # Copy the plain runs between backslashes as whole slices and only step
+    # through the escapes themselves.
     out = []
-    i = 0
+    pos = 0
     s = val
     L = len(s)
-    while i < L:
-        ch = s[i]
-        if ch != "\\":
-            out.append(ch)
-            i += 1
-            continue
-        i += 1
+    while j >= 0:
+        out.append(s[pos:j])
+        i = j + 1
         if i >= L:
             out.append("\\")
+            pos = L
             break
         nxt = s[i]
         i += 1
@@ -172,58 +255,288 @@ def unescape_pg(val: str):
             out.append("\t")
         elif nxt == "\\":
             out.append("\\")
-        elif nxt.isdigit():
-            octs = nxt
-            for _ in range(2):
-                if i < L and s[i].isdigit():
-                    octs += s[i]
-                    i += 1
-                else:
-                    break
-            try:
-                out.append(chr(int(octs, 8)))
-            except Exception:
-                out.append("\\" + octs)
+        elif nxt in PG_OCTAL_ESCAPES:
+            # Take the longest run of up to three digits.
+            octs = s[j + 1:j + 4]
+            ch = PG_OCTAL_ESCAPES.get(octs)
+            if ch is None:
+                octs = octs[:2]
+                ch = PG_OCTAL_ESCAPES.get(octs)
+                if ch is None:
+                    octs = nxt
+                    ch = PG_OCTAL_ESCAPES[octs]
+            out.append(ch)
+            i = j + 1 + len(octs)
         else:
             out.append(nxt)
+        pos = i
+        j = s.find("\\", pos)
+    out.append(s[pos:])
     return "".join(out)
 
 
-def load_editors(editor_file: str) -> dict[int, str]:
-    eid_to_name = {}
-    with open(editor_file, "r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            parts = line.rstrip("\n").split("\t")
-            if len(parts) < 2:
-                continue
-            try:
-                eid = int(parts[0])
-            except Exception:
-                continue
-            name = unescape_pg(parts[1]) or ""
-            eid_to_name[eid] = name
-    return eid_to_name
-
+def index_editors(editor_file: str) -> dict[int, int]:
+    """Map each editor id to the byte offset of its row in the editor file.
 
-def count_applied_edits(edit_file: str) -> dict[int, int]:
-    counts = defaultdict(int)
-    with open(edit_file, "r", encoding="utf-8", errors="replace") as f:
+    Only the editors that make the top list need a name, so names are
+    decoded later, for those rows only, by load_editor_names.
+    """
+    offsets = {}
+    pos = 0
+    with open(editor_file, "rb", buffering=READ_BUFFER_SIZE) as f:
+        fadvise(f.fileno(), FADV_SEQUENTIAL)
         for line in f:
-            parts = line.rstrip("\n").split("\t")
-            if len(parts) < 4:
-                continue
-            eid_raw    = unescape_pg(parts[1])
-            status_raw = unescape_pg(parts[3])
-            if eid_raw is None or status_raw is None:
-                continue
-            try:
-                if int(status_raw) == APPLIED_STATUS_CODE:
-                    counts[int(eid_raw)] += 1
-            except Exception:
+            tab = line.find(b"\t")
+            # id is a serial column; a non-integer here means a broken file,
+            # which main reports once instead of paying for a try per row.
+            if tab > 0:
+                offsets[int(line[:tab])] = pos
+            pos += len(line)
+    return offsets
+
+
+def load_editor_names(editor_file: str, offsets: dict[int, int], eids) -> dict[int, str]:
+    names = {}
+    with open(editor_file, "rb") as f:
+        for eid in eids:
+            pos = offsets.get(eid)
+            if pos is None:
                 continue
+            f.seek(pos)
+            parts = f.readline().rstrip(b"\n").split(b"\t", 2)
+            # Only the name column needs decoding.
+            names[eid] = unescape_pg(parts[1].decode("utf-8", errors="replace")) or ""
+    return names
+
+
+def _tally(totals, ids):
+    """Add editor ids to a running tally and return it.
+
+    With numpy the tally is a dense array indexed by editor id and each
+    batch is folded in with one bincount; otherwise it is a Counter.
+    """
+    if np is None:
+        totals.update(ids)
+        return totals
+    binc = np.bincount(ids)
+    if len(binc) > len(totals):
+        binc[:len(totals)] += totals
+        return binc
+    totals[:len(binc)] += binc
+    return totals
+
+
+def _new_tally():
+    return Counter() if np is None else np.zeros(0, dtype=np.int64)
+
+
+def _tally_result(totals):
+    return dict(totals) if np is None else totals
+
+
+def _newline_ranges(mm, start: int, end: int, step: int):
+    """Split [start, end) of a mapped file into consecutive (lo, hi) ranges
+    of about step bytes each.
+
+    Every inner boundary is the offset of a newline, so no row is cut in
+    two; the newline belongs to the later range, which therefore starts on
+    it. Only a range starting at offset 0 has no newline in front of its
+    first row.
+    """
+    lo = start
+    while lo < end:
+        hi = mm.find(b"\n", lo + max(step, 1), end)
+        if hi < 0:
+            hi = end
+        yield lo, hi
+        lo = hi
+
+
+def _scan_edit_range(edit_file: str, start: int, end: int) -> Counter:
+    """Tally applied edits in bytes [start, end) of the edit file, keyed by
+    the raw editor id bytes. start is 0 or the offset of a newline, end is
+    the file size or the offset of a newline."""
+    # Map the file and let the compiled regex walk it in newline-aligned
+    # windows; Python only sees the editor id of each applied row, and
+    # Counter tallies those in C.
+    counts = Counter()
+    begin = start
+    with open(edit_file, "rb") as f:
+        fadvise(f.fileno(), FADV_SEQUENTIAL, begin, end - begin)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                page = begin - begin % mmap.PAGESIZE
+                mm.madvise(mmap.MADV_SEQUENTIAL, page, end - page)
+            if start == 0:
+                first = mm.find(b"\n", 0, end)
+                start = end if first < 0 else first
+                # The first row has no newline in front of it.
+                counts.update(APPLIED_EDIT_ROW.findall(b"\n" + mm[:start]))
+            for lo, hi in _newline_ranges(mm, start, end, SCAN_CHUNK_SIZE):
+                counts.update(APPLIED_EDIT_ROW.findall(mm, lo, hi))
+        # Each edit is read once; let the kernel reclaim this range.
+        fadvise(f.fileno(), FADV_DONTNEED, begin, end - begin)
     return counts
 
 
+def count_applied_edits(edit_file: str):
+    """Applied edits per editor id.
+
+    With numpy this is a dense int64 array indexed by editor id (zero for
+    editors without applied edits); without it, a dict of the non-zero
+    counts. top_editors and count_editors accept either.
+    """
+    size = os.path.getsize(edit_file)
+    if size == 0:
+        return _tally_result(_new_tally())
+    if numba is not None:
+        return _count_applied_edits_numba(edit_file)
+    return _count_applied_edits_regex(edit_file)
+
+
+def _count_applied_edits_regex(edit_file: str):
+    """Same as count_applied_edits, using only the standard library (plus
+    numpy for the result, if installed)."""
+    size = os.path.getsize(edit_file)
+    if size == 0:
+        return _tally_result(_new_tally())
+    # Split the file into one byte range per core, each boundary moved
+    # forward to the next newline, and scan the ranges in worker processes.
+    jobs = max(1, min(os.cpu_count() or 1, size // SCAN_CHUNK_SIZE))
+    with open(edit_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        ranges = list(_newline_ranges(mm, 0, size, -(-size // jobs)))
+    starts = [lo for lo, _ in ranges]
+    ends = [hi for _, hi in ranges]
+    if len(starts) == 1:
+        parts = [_scan_edit_range(edit_file, 0, size)]
+    else:
+        with ProcessPoolExecutor(max_workers=len(starts)) as pool:
+            parts = list(pool.map(_scan_edit_range, [edit_file] * len(starts), starts, ends))
+    # ids stay bytes until here, so int() runs once per editor, not per edit.
+    counts = parts[0]
+    for part in parts[1:]:
+        counts.update(part)
+    counts = {int(eid): cnt for eid, cnt in counts.items()}
+    if np is None:
+        return counts
+    totals = np.zeros(max(counts, default=-1) + 1, dtype=np.int64)
+    totals[list(counts)] = list(counts.values())
+    return totals
+
+
+def count_editors(counts) -> int:
+    """Number of editors with at least one applied edit."""
+    return len(counts) if np is None else int(np.count_nonzero(counts))
+
+
+def top_editors(counts, n: int) -> list[tuple[int, int]]:
+    """The n (editor_id, count) pairs with the most applied edits, most first.
+
+    Ties, including at the cut-off, go to the lower editor id on both the
+    numpy and the plain-dict path, so the snapshot does not depend on which
+    optional packages are installed.
+    """
+    if np is None:
+        # Partial selection: O(n log k) instead of sorting every editor.
+        return heapq.nlargest(n, counts.items(), key=lambda x: (x[1], -x[0]))
+    # np.partition finds the n-th largest count in linear time without
+    # building a tuple per editor; only the n winners are then sorted.
+    if len(counts) > n:
+        cutoff = max(np.partition(counts, -n)[-n], 1)
+    else:
+        cutoff = 1
+    above = np.flatnonzero(counts > cutoff)
+    eids = np.concatenate((above, np.flatnonzero(counts == cutoff)[:n - len(above)]))
+    eids = eids[np.argsort(-counts[eids], kind="stable")]
+    return list(zip(eids.tolist(), counts[eids].tolist()))
+
+
+def _applied_editor_ids(buf, starts, ends, out, out_starts, filled):
+    """Byte-level twin of APPLIED_EDIT_ROW for numba.
+
+    Each (starts[c], ends[c]) range is 0 or a newline offset up to the next
+    range's start; the editor id of every applied row in it is written to
+    out from out_starts[c], and filled[c] is set to the end of that run.
+    """
+    applied = 48 + APPLIED_STATUS_CODE
+    for c in prange(len(starts)):
+        p = starts[c]
+        end = ends[c]
+        k = out_starts[c]
+        if p > 0:
+            p += 1  # skip the newline the range starts on
+        while p < end:
+            field = 0
+            digits = 0
+            ok = True
+            eid = 0
+            status_len = 0
+            status = 0
+            while p < end and buf[p] != 10:
+                b = buf[p]
+                p += 1
+                if b == 9:
+                    if field < 3 and digits == 0:
+                        ok = False
+                        break
+                    field += 1
+                    digits = 0
+                    if field == 4:
+                        break
+                elif field < 3:
+                    # id, editor and type must be all digits
+                    if 48 <= b <= 57:
+                        digits += 1
+                        if field == 1:
+                            eid = eid * 10 + (b - 48)
+                    else:
+                        ok = False
+                        break
+                else:
+                    status_len += 1
+                    status = b
+            if ok and field == 4 and status_len == 1 and status == applied:
+                out[k] = eid
+                k += 1
+            while p < end and buf[p] != 10:
+                p += 1
+            p += 1
+        filled[c] = k
+
+
+if numba is not None:
+    _applied_editor_ids = numba.njit(parallel=True, cache=True, nogil=True)(_applied_editor_ids)
+
+
+def _count_applied_edits_numba(edit_file: str):
+    """Same as count_applied_edits, but runs the row parser as a numba
+    kernel over the mmap'd bytes, one newline-aligned slice per thread."""
+    totals = _new_tally()
+    threads = numba.get_num_threads()
+    with open(edit_file, "rb") as f:
+        fadvise(f.fileno(), FADV_SEQUENTIAL)
+        # np.memmap maps the same open file for the kernel (so it shares the
+        # readahead hint); mm is only used to find newline boundaries.
+        buf = np.memmap(f, dtype=np.uint8, mode="r")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start, end in _newline_ranges(mm, 0, len(mm), SCAN_CHUNK_SIZE):
+                slices = list(_newline_ranges(mm, start, end, -(-(end - start) // threads)))
+                starts = np.array([lo for lo, _ in slices], dtype=np.int64)
+                ends = np.array([hi for _, hi in slices], dtype=np.int64)
+                # An applied row takes at least 8 bytes (four digit columns
+                # and their tabs), which bounds how many ids a slice yields.
+                caps = (ends - starts) // 8 + 1
+                out_starts = np.concatenate(([0], np.cumsum(caps)[:-1]))
+                out = np.empty(int(caps.sum()), dtype=np.int32)
+                filled = np.empty(len(starts), dtype=np.int64)
+                _applied_editor_ids(buf, starts, ends, out, out_starts, filled)
+                ids = np.concatenate([out[a:b] for a, b in zip(out_starts, filled)])
+                totals = _tally(totals, ids)
+        del buf  # unmap before dropping the cached pages
+        fadvise(f.fileno(), FADV_DONTNEED)
+    return _tally_result(totals)
+
+
 # ---------------------------------------------------------------------------
 # JSON output
 # ---------------------------------------------------------------------------
@@ -239,8 +552,11 @@ def write_snapshot(path: str, rows, snapshot_date: str):
         for i, (eid, name, cnt) in enumerate(rows, start=1)
     ]
     os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Serialise to one string and write it once; json.dump would issue a
+    # separate write for every token of the indented output.
+    text = json.dumps(data, ensure_ascii=False, indent=2)
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write(text)
 
 
 # ---------------------------------------------------------------------------
@@ -391,20 +707,26 @@ def main():
 
     # --- Process ---
     print(f"\n[3/5] Processing ...")
-    print(f"  Reading editors from {editor_file}")
-    editors = load_editors(editor_file)
+    print(f"  Indexing editors in {editor_file}")
+    try:
+        editors = index_editors(editor_file)
+    except ValueError as e:
+        sys.exit(f"❌ Could not parse {editor_file}: {e}")
     print(f"  Loaded {len(editors):,} editors.")
 
     print(f"  Counting applied edits from {edit_file}")
-    counts = count_applied_edits(edit_file)
-    print(f"  Counted edits for {len(counts):,} editors.")
-
-    rows = [
-        (eid, editors.get(eid, f"(editor #{eid})"), cnt)
-        for eid, cnt in counts.items()
+    try:
+        counts = count_applied_edits(edit_file)
+    except ValueError as e:
+        sys.exit(f"❌ Could not parse {edit_file}: {e}")
+    print(f"  Counted edits for {count_editors(counts):,} editors.")
+
+    top_counts = top_editors(counts, 500)
+    names = load_editor_names(editor_file, editors, [eid for eid, _ in top_counts])
+    top = [
+        (eid, names.get(eid, f"(editor #{eid})"), cnt)
+        for eid, cnt in top_counts
     ]
-    rows.sort(key=lambda x: x[2], reverse=True)
-    top = rows[:500]
 
     # --- Write snapshot ---
     print(f"\n[4/5] Writing output ...")
@@ -0,0 +1,118 @@
+"""Cross-checks the edit-file scan backends against each other.
+
+count_applied_edits only ever runs one backend on a given machine (numba
+if installed, else the regex scan), so each available backend is run here
+on the same synthetic dump and compared with a plain split() reference.
+
+    python -m unittest test_checkmbeditors
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+import checkmbeditors as cme
+
+
+def synthetic_edit_dump(path: str, rows: int = 20000, seed: int = 1):
+    """Write an edit table in COPY text format, with some malformed rows."""
+    rnd = random.Random(seed)
+    # \x01 never occurs in a real edit table; a reader that splits lines on
+    # it must still skip such a row rather than fail.
+    bad_values = [r"\N", "", "x1", "1x", "-1", "2 ", "2\x01", "\x01"]
+    with open(path, "w") as f:
+        for i in range(rows):
+            cols = [
+                str(i),
+                str(int(rnd.paretovariate(1.2)) % 3000 + 1),
+                str(rnd.randint(1, 300)),
+                rnd.choice("2222221345"),
+                "f",
+                "2010-01-01 00:00:00+00",
+                "2010-01-08 00:00:00+00",
+                "2010-01-08 00:00:00+00",
+                r"\N",
+                "1",
+            ]
+            if rnd.random() < 0.02:
+                cols[rnd.choice([0, 1, 2, 3])] = rnd.choice(bad_values + ["22"])
+            if rnd.random() < 0.005:
+                cols = cols[:4]
+            if i == rows // 2:
+                cols[:5] = ["1", "2", "3", "2\x01", ""]
+            f.write("\t".join(cols))
+            if i < rows - 1 or rnd.random() < 0.5:
+                f.write("\n")
+
+
+def reference_counts(path: str) -> dict[int, int]:
+    counts = {}
+    with open(path, "rb") as f:
+        for line in f:
+            parts = line.rstrip(b"\n").split(b"\t")
+            if (len(parts) >= 5 and all(p.isdigit() for p in parts[:3])
+                    and parts[3] == b"2"):
+                eid = int(parts[1])
+                counts[eid] = counts.get(eid, 0) + 1
+    return counts
+
+
+def as_dict(counts) -> dict[int, int]:
+    if isinstance(counts, dict):
+        return counts
+    return {eid: cnt for eid, cnt in enumerate(counts.tolist()) if cnt}
+
+
+class ScanBackendTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.edit_file = os.path.join(cls.tmp.name, "edit")
+        synthetic_edit_dump(cls.edit_file)
+        cls.expected = reference_counts(cls.edit_file)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def backends(self):
+        yield "regex", cme._count_applied_edits_regex, {}
+        if cme.np is not None:
+            yield "regex without numpy", cme._count_applied_edits_regex, {"np": None}
+        if cme.numba is not None:
+            yield "numba", cme._count_applied_edits_numba, {}
+
+    def test_backends_agree(self):
+        # A tiny window size makes every backend cross many range boundaries.
+        for chunk_size in (cme.SCAN_CHUNK_SIZE, 4096):
+            for name, scan, overrides in self.backends():
+                with self.subTest(backend=name, chunk_size=chunk_size), \
+                        mock.patch.multiple(cme, SCAN_CHUNK_SIZE=chunk_size, **overrides):
+                    self.assertEqual(as_dict(scan(self.edit_file)), self.expected)
+
+    def test_empty_file(self):
+        with open(os.path.join(self.tmp.name, "empty"), "wb"):
+            pass
+        counts = cme.count_applied_edits(os.path.join(self.tmp.name, "empty"))
+        self.assertEqual(as_dict(counts), {})
+
+
+class TopEditorsTest(unittest.TestCase):
+
+    def test_ties_go_to_lower_editor_id(self):
+        counts = {7: 3, 2: 5, 9: 3, 4: 3, 1: 1}
+        expected = [(2, 5), (4, 3), (7, 3)]
+        with mock.patch.object(cme, "np", None):
+            self.assertEqual(cme.top_editors(counts, 3), expected)
+        if cme.np is not None:
+            dense = cme.np.zeros(10, dtype=cme.np.int64)
+            for eid, cnt in counts.items():
+                dense[eid] = cnt
+            self.assertEqual(cme.top_editors(dense, 3), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()